@@ -24,6 +24,13 @@ class AlertManager:
         
         # Alert callbacks
         self.alert_callbacks = []
+        
+        # (metric, title, message format, value at which the alert is critical)
+        self._checks = (
+            ('cpu', 'High CPU Usage', 'CPU usage is at {:.1f}%', 95),
+            ('memory', 'High Memory Usage', 'Memory usage is at {:.1f}%', 95),
+            ('disk', 'Low Disk Space', 'Disk usage is at {:.1f}%', 0)
+        )
     
     def set_threshold(self, metric: str, value: float):
         """Set threshold for a metric"""
@@ -44,43 +51,29 @@ class AlertManager:
         alerts = []
         current_time = time.time()
         
-        # Check CPU
-        if cpu_percent > self.thresholds['cpu']:
-            if self._should_alert('cpu', current_time):
-                alerts.append({
-                    'type': 'cpu',
-                    'level': 'warning' if cpu_percent < 95 else 'critical',
-                    'title': 'High CPU Usage',
-                    'message': f'CPU usage is at {cpu_percent:.1f}%',
-                    'value': cpu_percent
-                })
+        # Locals avoid repeated attribute lookups in the steady state where
+        # nothing is over its threshold
+        th = self.thresholds
+        last = self.last_alerts
+        cooldown = self.alert_cooldown
+        values = (cpu_percent, mem_percent, disk_percent)
         
-        # Check Memory
-        if mem_percent > self.thresholds['memory']:
-            if self._should_alert('memory', current_time):
+        # Check CPU, Memory and Disk
+        for (metric, title, fmt, critical_at), value in zip(self._checks, values):
+            if value > th[metric] and current_time - last.get(metric, 0) >= cooldown:
+                last[metric] = current_time
                 alerts.append({
-                    'type': 'memory',
-                    'level': 'warning' if mem_percent < 95 else 'critical',
-                    'title': 'High Memory Usage',
-                    'message': f'Memory usage is at {mem_percent:.1f}%',
-                    'value': mem_percent
-                })
-        
-        # Check Disk
-        if disk_percent > self.thresholds['disk']:
-            if self._should_alert('disk', current_time):
-                alerts.append({
-                    'type': 'disk',
-                    'level': 'critical',
-                    'title': 'Low Disk Space',
-                    'message': f'Disk usage is at {disk_percent:.1f}%',
-                    'value': disk_percent
+                    'type': metric,
+                    'level': 'warning' if value < critical_at else 'critical',
+                    'title': title,
+                    'message': fmt.format(value),
+                    'value': value
                 })
         
         # Check Battery (low battery)
         if battery_info and not battery_info.get('plugged', True):
             battery_percent = battery_info.get('percent', 100)
-            if battery_percent < self.thresholds['battery']:
+            if battery_percent < th['battery']:
                 if self._should_alert('battery', current_time):
                     alerts.append({
                         'type': 'battery',
@@ -90,6 +83,9 @@ class AlertManager:
                         'value': battery_percent
                     })
         
+        if not alerts:
+            return alerts
+        
         # Trigger callbacks for all alerts
         for alert in alerts:
             for callback in self.alert_callbacks:
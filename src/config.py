@@ -2,10 +2,26 @@
 Configuration management for Resource Monitor
 """
 
+import atexit
 import json
 import os
+import threading
+import time
+import weakref
 from typing import Dict, Any
 
+_HOME = os.path.expanduser("~")
+
+# Live Config objects, flushed once at interpreter exit
+_instances = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Write out debounced changes of every live Config"""
+    for config in list(_instances):
+        config.flush()
+
 
 class Config:
     """Manage application configuration"""
@@ -28,6 +44,9 @@ class Config:
         'history_size': 60
     }
     
+    # Minimum seconds between writes triggered by set()
+    SAVE_DEBOUNCE = 5.0
+    
     def __init__(self, config_path: str = None):
         """
         Initialize configuration
@@ -36,62 +55,114 @@ class Config:
             config_path: Path to config file, defaults to ~/.config/resource_monitor/config.json
         """
         if config_path is None:
-            home = os.path.expanduser("~")
-            config_dir = os.path.join(home, ".config", "resource_monitor")
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
+            config_dir = os.path.join(_HOME, ".config", "resource_monitor")
+            os.makedirs(config_dir, exist_ok=True)
             config_path = os.path.join(config_dir, "config.json")
         
         self.config_path = config_path
         self.config = self.DEFAULT_CONFIG.copy()
+        self._get_cache: Dict[str, Any] = {}
+        self._last_payload = None
+        self._last_save = 0.0
+        self._dirty = False
+        self._save_timer = None
+        self._lock = threading.RLock()
         self.load()
+        
+        # Make sure debounced changes reach disk
+        _instances.add(self)
     
     def load(self):
         """Load configuration from file"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults (in case new keys were added)
-                    self.config.update(loaded_config)
+                with open(self.config_path, 'rb') as f:
+                    payload = f.read()
+                loaded_config = json.loads(payload)
+                # Merge with defaults (in case new keys were added)
+                self.config.update(loaded_config)
+                self._get_cache.clear()
+                self._last_payload = payload
             except Exception as e:
                 print(f"Error loading config: {e}, using defaults")
     
     def save(self):
-        """Save configuration to file"""
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        """Save configuration to file, skipping the write if nothing changed"""
+        with self._lock:
+            self._last_save = time.monotonic()
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            try:
+                payload = json.dumps(self.config, indent=2).encode()
+                if payload != self._last_payload:
+                    # Write to a temp file and swap it in so a crash can't leave
+                    # a truncated config behind
+                    tmp_path = self.config_path + '.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.config_path)
+                    self._last_payload = payload
+                self._dirty = False
+            except Exception as e:
+                print(f"Error saving config: {e}")
+    
+    def flush(self):
+        """Save configuration if there are unsaved changes"""
+        with self._lock:
+            if self._dirty:
+                self.save()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
-        keys = key.split('.')
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+        
         value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
+        for k in key.split('.'):
+            if isinstance(value, dict) and k in value:
+                value = value[k]
             else:
                 return default
+        
+        # Only resolved keys are cached, misses depend on the caller's default
+        self._get_cache[key] = value
         return value
     
     def set(self, key: str, value: Any):
         """Set configuration value"""
         keys = key.split('.')
-        config = self.config
         
-        # Navigate to the parent of the final key
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
-        # Set the final value
-        config[keys[-1]] = value
-        self.save()
+        with self._lock:
+            config = self.config
+            
+            # Navigate to the parent of the final key
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            
+            # Set the final value
+            config[keys[-1]] = value
+            self._get_cache.clear()
+            
+            # Debounce writes, a timer flushes whatever is still pending
+            self._dirty = True
+            elapsed = time.monotonic() - self._last_save
+            if elapsed >= self.SAVE_DEBOUNCE:
+                self.save()
+            elif self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DEBOUNCE - elapsed,
+                                                   self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
         self.config = self.DEFAULT_CONFIG.copy()
+        self._get_cache.clear()
         self.save()
@@ -5,8 +5,21 @@ Data export and logging functionality
 import csv
 import json
 import os
-from datetime import datetime
-from typing import Dict, List
+import struct
+import time
+from typing import Dict, Iterable, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib encoder
+
+_HOME = os.path.expanduser("~")
+
+
+def _fname_ts() -> str:
+    """Timestamp used in generated file names"""
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
 class DataExporter:
@@ -15,45 +28,57 @@ class DataExporter:
     def __init__(self, export_dir: str = None):
         """Initialize exporter with directory path"""
         if export_dir is None:
-            home = os.path.expanduser("~")
-            export_dir = os.path.join(home, "Documents", "ResourceMonitor_Exports")
+            export_dir = os.path.join(_HOME, "Documents", "ResourceMonitor_Exports")
         
         self.export_dir = export_dir
         
         # Create export directory if it doesn't exist
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
     
-    def export_to_csv(self, data_points: List[Dict], filename: str = None) -> str:
+    def export_to_csv(self, data_points: Iterable[Dict], filename: str = None,
+                      fieldnames: List[str] = None) -> str:
         """
         Export data points to CSV file
         
         Args:
-            data_points: List of dictionaries containing metrics
+            data_points: List or iterable of dictionaries containing metrics
             filename: Optional custom filename
+            fieldnames: Optional column order, derived from the data if omitted
         
         Returns:
             Path to the created file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _fname_ts()
             filename = f"resource_monitor_{timestamp}.csv"
         
         filepath = os.path.join(self.export_dir, filename)
         
-        if not data_points:
+        rows = iter(data_points)
+        first = next(rows, None)
+        if first is None:
             return filepath
         
-        # Get all unique keys from data points
-        fieldnames = set()
-        for point in data_points:
-            fieldnames.update(point.keys())
-        fieldnames = sorted(list(fieldnames))
+        if fieldnames is None:
+            if rows is not data_points:
+                # Get all unique keys from data points, rows sharing the
+                # first row's schema (the usual case) are skipped cheaply
+                first_keys = first.keys()
+                keys = set(first_keys)
+                for point in data_points:
+                    if point.keys() != first_keys:
+                        keys.update(point.keys())
+            else:
+                # One-shot iterators can only be walked once, use the first row's schema
+                keys = first.keys()
+            fieldnames = sorted(keys)
         
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data_points)
+        with open(filepath, 'w', newline='', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerow(tuple(first.get(k, '') for k in fieldnames))
+            for point in rows:
+                writer.writerow(tuple(point.get(k, '') for k in fieldnames))
         
         return filepath
     
@@ -69,13 +94,25 @@ class DataExporter:
             Path to the created file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _fname_ts()
             filename = f"resource_monitor_{timestamp}.json"
         
         filepath = os.path.join(self.export_dir, filename)
         
-        with open(filepath, 'w') as jsonfile:
-            json.dump(data, jsonfile, indent=2, default=str)
+        # Datetimes go through default=str and text is written as UTF-8 on
+        # both paths so either encoder produces equivalent JSON. Float
+        # spelling (1e-05 vs 0.00001) and NaN handling still differ.
+        if orjson is not None:
+            data_bytes = orjson.dumps(data, default=str,
+                                      option=orjson.OPT_INDENT_2 |
+                                      orjson.OPT_PASSTHROUGH_DATETIME |
+                                      orjson.OPT_NON_STR_KEYS)
+        else:
+            data_bytes = json.dumps(data, indent=2, default=str,
+                                    ensure_ascii=False).encode()
+        
+        with open(filepath, 'wb', buffering=1 << 20) as jsonfile:
+            jsonfile.write(data_bytes)
         
         return filepath
     
@@ -90,23 +127,29 @@ class DataExporter:
             Path to the created JSON file
         """
         snapshot = {
-            'timestamp': datetime.now().isoformat(),
-            'cpu': system_monitor.get_cpu_info(),
-            'memory': system_monitor.get_memory_info(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'cpu': system_monitor.get_cpu_info(include_history=True),
+            'memory': system_monitor.get_memory_info(include_history=True),
             'disk': system_monitor.get_disk_info(),
-            'network': system_monitor.get_network_info(),
+            'network': system_monitor.get_network_info(include_history=True),
             'battery': system_monitor.get_battery_info(),
             'system_info': system_monitor.get_system_info(),
             'top_processes': system_monitor.get_process_list(limit=20)
         }
         
         return self.export_to_json(snapshot, 
-                                   f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+                                   f"snapshot_{_fname_ts()}.json")
 
 
 class MetricsLogger:
     """Continuous logging of system metrics"""
     
+    FIELDNAMES = ('timestamp', 'cpu_percent', 'memory_percent', 'disk_percent',
+                  'network_upload_bps', 'network_download_bps')
+    
+    # One fixed-size record per sample: epoch seconds, then the five metrics
+    RECORD = struct.Struct('<dfffff')
+    
     def __init__(self, log_dir: str = None, max_entries: int = 1000):
         """
         Initialize metrics logger
@@ -116,55 +159,99 @@ class MetricsLogger:
             max_entries: Maximum entries before creating new file
         """
         if log_dir is None:
-            home = os.path.expanduser("~")
-            log_dir = os.path.join(home, "Documents", "ResourceMonitor_Logs")
+            log_dir = os.path.join(_HOME, "Documents", "ResourceMonitor_Logs")
         
         self.log_dir = log_dir
         self.max_entries = max_entries
-        self.current_log = []
         
         # Create log directory if it doesn't exist
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
+        
+        # Samples are appended as packed binary records and converted to
+        # CSV when the segment is saved, the file is opened on first use
+        self._fh = None
+        self._filepath = None
+        self._row_count = 0
+    
+    def _open_log(self):
+        """Open a new binary log file"""
+        timestamp = _fname_ts()
+        base = os.path.join(self.log_dir, f"metrics_log_{timestamp}")
+        
+        # Don't clobber a log saved out within the same second
+        suffix = 1
+        name = base
+        while os.path.exists(name + '.bin') or os.path.exists(name + '.csv'):
+            name = f"{base}_{suffix}"
+            suffix += 1
+        self._filepath = name + '.bin'
+        
+        self._fh = open(self._filepath, 'ab', buffering=1 << 20)
+        self._row_count = 0
     
     def log_metrics(self, cpu: float, memory: float, disk: float, 
                    network_up: float, network_down: float):
         """Log current metrics"""
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'cpu_percent': round(cpu, 2),
-            'memory_percent': round(memory, 2),
-            'disk_percent': round(disk, 2),
-            'network_upload_bps': round(network_up, 2),
-            'network_download_bps': round(network_down, 2)
-        }
+        if self._fh is None:
+            self._open_log()
         
-        self.current_log.append(entry)
+        self._fh.write(self.RECORD.pack(time.time(), cpu, memory, disk,
+                                        network_up, network_down))
+        self._row_count += 1
         
-        # Auto-save if we hit max entries
-        if len(self.current_log) >= self.max_entries:
+        # Auto-save if we hit max entries, the next sample starts a new file
+        if self._row_count >= self.max_entries:
             self.save_log()
     
     def save_log(self) -> str:
-        """Save current log to file and clear buffer"""
-        if not self.current_log:
+        """Convert the current binary log to a CSV file and start a new one"""
+        if self._fh is None:
             return None
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"metrics_log_{timestamp}.csv"
-        filepath = os.path.join(self.log_dir, filename)
+        self._fh.close()
+        self._fh = None
+        bin_path = self._filepath
+        row_count = self._row_count
+        self._filepath = None
+        self._row_count = 0
         
-        fieldnames = ['timestamp', 'cpu_percent', 'memory_percent', 'disk_percent',
-                     'network_upload_bps', 'network_download_bps']
+        if not row_count:
+            os.remove(bin_path)
+            return None
+        
+        with open(bin_path, 'rb') as f:
+            data = f.read()
         
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.current_log)
+        filepath = os.path.splitext(bin_path)[0] + '.csv'
         
-        self.current_log.clear()
+        # Timestamp string is only rebuilt when the wall-clock second changes
+        last_epoch = None
+        ts = ''
+        with open(filepath, 'w', newline='', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(self.FIELDNAMES)
+            for t, cpu, memory, disk, net_up, net_down in self.RECORD.iter_unpack(data):
+                epoch = int(t)
+                if epoch != last_epoch:
+                    last_epoch = epoch
+                    ts = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(epoch))
+                writer.writerow((
+                    ts,
+                    f"{cpu:.2f}",
+                    f"{memory:.2f}",
+                    f"{disk:.2f}",
+                    f"{net_up:.2f}",
+                    f"{net_down:.2f}"
+                ))
+        
+        # The CSV now holds every sample, drop the binary segment
+        os.remove(bin_path)
         return filepath
     
+    def close(self) -> str:
+        """Save any pending samples and close the log"""
+        return self.save_log()
+    
     def get_log_count(self) -> int:
         """Get number of entries in current log"""
-        return len(self.current_log)
+        return self._row_count
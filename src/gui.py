@@ -4,33 +4,41 @@ Real-time dashboard with graphs and metrics
 """
 
 import tkinter as tk
-from tkinter import ttk, font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from tkinter import ttk
+import numpy as np
+import queue
 import threading
 import time
-from datetime import datetime
 import sys
 import os
 
 # Add parent directory to path to import system_monitor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.system_monitor import SystemMonitor
 
 
 class ResourceMonitorGUI:
     """Main GUI application for system resource monitoring"""
     
+    # Refresh cadence, in samples, for the costlier parts of the dashboard
+    GRAPH_TICKS = 2
+    PROCESS_TICKS = 5
+    
     def __init__(self, root):
         self.root = root
         self.root.title("System Resource Monitor")
         self.root.geometry("1200x800")
         
         # Initialize monitor
+        from src.system_monitor import SystemMonitor
         self.monitor = SystemMonitor(history_size=60)
+        self.logger = None  # Optional MetricsLogger
         self.running = True
         self.update_interval = 1000  # milliseconds
+        self._tick = 0
+        
+        # Processes are only enumerated while their tab is showing
+        self._processes_visible = False
+        self._process_countdown = 0
         
         # Configure style
         self.setup_style()
@@ -38,8 +46,15 @@ class ResourceMonitorGUI:
         # Create main layout
         self.create_layout()
         
+        # Sample metrics on a background thread so psutil calls never block Tk
+        self._q = queue.Queue()
+        self._sort_by = self.sort_var.get()
+        self._limit = 20
+        self.sampler_thread = threading.Thread(target=self._sampler_loop, daemon=True)
+        self.sampler_thread.start()
+        
         # Start monitoring
-        self.update_data()
+        self.root.after(100, self._drain_queue)
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -79,9 +94,23 @@ class ResourceMonitorGUI:
         self.info_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.info_frame, text='System Info')
         self.create_info_tab()
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+    
+    def _on_tab_changed(self, event):
+        """Track whether the Processes tab is visible"""
+        self._processes_visible = self.notebook.select() == str(self.processes_frame)
+        if self._processes_visible:
+            # Refresh right away instead of waiting out the countdown
+            self._process_countdown = 0
     
     def create_overview_tab(self):
         """Create the overview tab with graphs and metrics"""
+        # matplotlib is slow to import, so only load it once the graphs are built
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.animation import FuncAnimation
+        
         # Left panel - Metrics
         left_panel = tk.Frame(self.overview_frame, bg='#2d2d2d', width=300)
         left_panel.pack(side='left', fill='y', padx=5, pady=5)
@@ -106,6 +135,15 @@ class ResourceMonitorGUI:
         right_panel = tk.Frame(self.overview_frame, bg='#2d2d2d')
         right_panel.pack(side='right', fill='both', expand=True, padx=5, pady=5)
         
+        # Fixed x axis and reusable y buffers for the graphs, float32 is
+        # plenty for a percentage or MB/s readout
+        history_size = self.monitor.history_size
+        self._x = np.arange(history_size, dtype=np.float32)
+        self._cpu_hist = np.zeros(history_size, dtype=np.float32)
+        self._mem_hist = np.zeros(history_size, dtype=np.float32)
+        self._net_up = np.zeros(history_size, dtype=np.float32)
+        self._net_down = np.zeros(history_size, dtype=np.float32)
+        
         # Create matplotlib figures
         self.fig = Figure(figsize=(10, 8), facecolor='#2d2d2d')
         
@@ -113,37 +151,62 @@ class ResourceMonitorGUI:
         self.ax_cpu = self.fig.add_subplot(3, 1, 1)
         self.ax_cpu.set_facecolor('#1e1e1e')
         self.ax_cpu.set_title('CPU Usage (%)', color='white', fontsize=10)
+        self.ax_cpu.set_xlim(0, history_size)
         self.ax_cpu.set_ylim(0, 100)
         self.ax_cpu.grid(True, alpha=0.3)
-        self.cpu_line, = self.ax_cpu.plot([], [], color='#51cf66', linewidth=2)
+        self.cpu_line, = self.ax_cpu.plot([], [], color='#51cf66', linewidth=2, animated=True)
         self.ax_cpu.tick_params(colors='white', labelsize=8)
         
         # Memory Graph
         self.ax_memory = self.fig.add_subplot(3, 1, 2)
         self.ax_memory.set_facecolor('#1e1e1e')
         self.ax_memory.set_title('Memory Usage (%)', color='white', fontsize=10)
+        self.ax_memory.set_xlim(0, history_size)
         self.ax_memory.set_ylim(0, 100)
         self.ax_memory.grid(True, alpha=0.3)
-        self.memory_line, = self.ax_memory.plot([], [], color='#339af0', linewidth=2)
+        self.memory_line, = self.ax_memory.plot([], [], color='#339af0', linewidth=2, animated=True)
         self.ax_memory.tick_params(colors='white', labelsize=8)
         
         # Network Graph
         self.ax_network = self.fig.add_subplot(3, 1, 3)
         self.ax_network.set_facecolor('#1e1e1e')
         self.ax_network.set_title('Network Usage (MB/s)', color='white', fontsize=10)
+        self.ax_network.set_xlim(0, history_size)
+        self.ax_network.set_ylim(0, 1.2)
         self.ax_network.grid(True, alpha=0.3)
-        self.network_line_up, = self.ax_network.plot([], [], color='#ff6b6b', linewidth=2, label='Upload')
-        self.network_line_down, = self.ax_network.plot([], [], color='#51cf66', linewidth=2, label='Download')
+        self.network_line_up, = self.ax_network.plot([], [], color='#ff6b6b', linewidth=2,
+                                                     label='Upload', animated=True)
+        self.network_line_down, = self.ax_network.plot([], [], color='#51cf66', linewidth=2,
+                                                       label='Download', animated=True)
         self.ax_network.legend(loc='upper right', fontsize=8)
         self.ax_network.tick_params(colors='white', labelsize=8)
         
+        self._lines = (self.cpu_line, self.memory_line,
+                       self.network_line_up, self.network_line_down)
+        self._net_ylim = self.ax_network.get_ylim()
+        
         self.fig.tight_layout()
         
         # Embed matplotlib figure
         self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
+        
+        # Only the line artists are re-rendered each frame, the static axes
+        # are blitted from a cached background
+        self._ani = FuncAnimation(self.fig, self._animate, interval=self.update_interval,
+                                  blit=True, cache_frame_data=False)
+        
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
     
+    def _animate(self, frame):
+        """Animation callback, returns the artists to blit"""
+        if self._net_ylim != self.ax_network.get_ylim():
+            # Axis ticks change, so redraw the figure before the animation
+            # re-caches its background for the new view
+            self.ax_network.set_ylim(self._net_ylim)
+            self.canvas.draw()
+        return self._lines
+    
     def create_metric_section(self, parent, title, metric_type):
         """Create a metric display section"""
         frame = tk.Frame(parent, bg='#3d3d3d', relief='raised', borderwidth=1)
@@ -169,6 +232,16 @@ class ResourceMonitorGUI:
         # Store references
         setattr(self, f'{metric_type}_progress', progress_bar)
         setattr(self, f'{metric_type}_details', details_label)
+        
+        # Bound setter so update_data doesn't look the widgets up every tick
+        set_progress = progress_bar.configure
+        set_details = details_label.configure
+        
+        def set_metric(percent, details):
+            set_progress(value=percent)
+            set_details(text=details)
+        
+        setattr(self, f'_set_{metric_type}', set_metric)
     
     def create_processes_tab(self):
         """Create the processes tab with sortable table"""
@@ -209,6 +282,7 @@ class ResourceMonitorGUI:
             self.process_tree.column(col, width=150)
         
         self.process_tree.pack(fill='both', expand=True)
+        self._row_iids = []
         scrollbar.config(command=self.process_tree.yview)
     
     def create_info_tab(self):
@@ -238,112 +312,168 @@ Uptime: {info['uptime']}
         info_text.insert('1.0', info_str)
         info_text.config(state='disabled')
     
-    def update_data(self):
-        """Update all data and GUI elements"""
+    def _sampler_loop(self):
+        """Collect metrics in the background and hand them to the GUI thread"""
+        while self.running:
+            try:
+                self.monitor.tick()
+                snapshot = {
+                    'cpu': self.monitor.get_cpu_info(include_history=True),
+                    'memory': self.monitor.get_memory_info(include_history=True),
+                    'disk': self.monitor.get_disk_info(),
+                    'network': self.monitor.get_network_info(include_history=True),
+                    'battery': self.monitor.get_battery_info(),
+                    'processes': None
+                }
+                # (upload, download) rows as float32, converted off the Tk thread
+                snapshot['network_rates'] = np.asarray(snapshot['network']['history'],
+                                                       dtype=np.float32)
+                
+                # Process enumeration is by far the costliest call, so run it
+                # at a slower cadence and only when someone can see the table
+                if self._processes_visible:
+                    if self._process_countdown <= 0:
+                        snapshot['processes'] = self.monitor.get_process_list(
+                            sort_by=self._sort_by, limit=self._limit)
+                        self._process_countdown = self.PROCESS_TICKS
+                    self._process_countdown -= 1
+                
+                self._q.put(snapshot)
+            except Exception as e:
+                print(f"Error sampling metrics: {e}")
+            time.sleep(self.update_interval / 1000)
+    
+    def _drain_queue(self):
+        """Apply the latest snapshot from the sampler thread"""
         if not self.running:
             return
         
-        # Get data
-        cpu_info = self.monitor.get_cpu_info()
-        mem_info = self.monitor.get_memory_info()
-        disk_info = self.monitor.get_disk_info()
-        net_info = self.monitor.get_network_info()
-        battery_info = self.monitor.get_battery_info()
+        # Only the newest snapshot matters, discard any stale ones but keep
+        # the latest process list, which only some snapshots carry
+        snapshot = None
+        processes = None
+        try:
+            while True:
+                snapshot = self._q.get_nowait()
+                if snapshot['processes'] is not None:
+                    processes = snapshot['processes']
+        except queue.Empty:
+            pass
+        
+        if snapshot is not None:
+            snapshot['processes'] = processes
+        
+        # Tk variables may only be read here, so hand the sampler plain values
+        self._sort_by = self.sort_var.get()
+        try:
+            self._limit = int(self.limit_var.get())
+        except ValueError:
+            self._limit = 20
+        
+        if snapshot is not None:
+            self.update_data(snapshot)
+        
+        self.root.after(100, self._drain_queue)
+    
+    def update_data(self, snapshot):
+        """Update all GUI elements from a metrics snapshot"""
+        cpu_info = snapshot['cpu']
+        mem_info = snapshot['memory']
+        disk_info = snapshot['disk']
+        net_info = snapshot['network']
+        battery_info = snapshot['battery']
         
         # Update CPU
-        self.cpu_progress['value'] = cpu_info['percent']
         cpu_details = f"{cpu_info['percent']:.1f}%\n"
         cpu_details += f"Cores: {cpu_info['cores']} / Threads: {cpu_info['threads']}\n"
         cpu_details += f"Frequency: {cpu_info['frequency']:.0f} MHz"
-        self.cpu_details.config(text=cpu_details)
+        self._set_cpu(cpu_info['percent'], cpu_details)
         
         # Update Memory
-        self.memory_progress['value'] = mem_info['percent']
         mem_details = f"{mem_info['percent']:.1f}%\n"
         mem_details += f"Used: {self.monitor.format_bytes(mem_info['used'])}\n"
         mem_details += f"Available: {self.monitor.format_bytes(mem_info['available'])}"
-        self.memory_details.config(text=mem_details)
+        self._set_memory(mem_info['percent'], mem_details)
         
         # Update Disk
-        self.disk_progress['value'] = disk_info['percent']
         disk_details = f"{disk_info['percent']:.1f}%\n"
         disk_details += f"Read: {self.monitor.format_speed(disk_info['read_rate'])}\n"
         disk_details += f"Write: {self.monitor.format_speed(disk_info['write_rate'])}"
-        self.disk_details.config(text=disk_details)
+        self._set_disk(disk_info['percent'], disk_details)
         
         # Update Network
         net_percent = min(100, (net_info['sent_rate'] + net_info['recv_rate']) / (1024 * 1024))
-        self.network_progress['value'] = net_percent
         net_details = f"Up: {self.monitor.format_speed(net_info['sent_rate'])}\n"
         net_details += f"Down: {self.monitor.format_speed(net_info['recv_rate'])}\n"
         net_details += f"Total: {self.monitor.format_bytes(net_info['bytes_sent'] + net_info['bytes_recv'])}"
-        self.network_details.config(text=net_details)
+        self._set_network(net_percent, net_details)
         
         # Update Battery
         if battery_info:
-            self.battery_progress['value'] = battery_info['percent']
             batt_details = f"{battery_info['percent']:.1f}%\n"
             batt_details += f"Status: {'Charging' if battery_info['plugged'] else 'Discharging'}\n"
             if battery_info['time_left']:
                 hours = battery_info['time_left'] // 3600
                 minutes = (battery_info['time_left'] % 3600) // 60
                 batt_details += f"Time left: {hours}h {minutes}m"
-            self.battery_details.config(text=batt_details)
+            self._set_battery(battery_info['percent'], batt_details)
         
         # Update graphs
-        self.update_graphs(cpu_info, mem_info, net_info)
+        if self._tick % self.GRAPH_TICKS == 0:
+            self.update_graphs(cpu_info, mem_info, snapshot['network_rates'])
+        self._tick += 1
         
         # Update process list
-        self.update_process_list()
-        
-        # Schedule next update
-        self.root.after(self.update_interval, self.update_data)
+        if snapshot['processes'] is not None:
+            self.update_process_list(snapshot['processes'])
     
-    def update_graphs(self, cpu_info, mem_info, net_info):
-        """Update the matplotlib graphs"""
+    def update_graphs(self, cpu_info, mem_info, network_rates):
+        """Update the graph data, drawing is left to the animation"""
+        x = self._x
+        
         # CPU graph
-        x_data = list(range(len(cpu_info['history'])))
-        self.cpu_line.set_data(x_data, cpu_info['history'])
-        self.ax_cpu.set_xlim(0, max(60, len(cpu_info['history'])))
+        n = len(cpu_info['history'])
+        self._cpu_hist[:n] = cpu_info['history']
+        self.cpu_line.set_data(x[:n], self._cpu_hist[:n])
         
         # Memory graph
-        x_data = list(range(len(mem_info['history'])))
-        self.memory_line.set_data(x_data, mem_info['history'])
-        self.ax_memory.set_xlim(0, max(60, len(mem_info['history'])))
+        n = len(mem_info['history'])
+        self._mem_hist[:n] = mem_info['history']
+        self.memory_line.set_data(x[:n], self._mem_hist[:n])
         
         # Network graph
-        if net_info['history']:
-            x_data = list(range(len(net_info['history'])))
-            upload_data = [s / (1024 * 1024) for s, r in net_info['history']]  # Convert to MB/s
-            download_data = [r / (1024 * 1024) for s, r in net_info['history']]
+        n = len(network_rates)
+        if n:
+            # Convert to MB/s straight into the preallocated buffers
+            upload_data = np.multiply(network_rates[:, 0], 1 / (1024 * 1024),
+                                      out=self._net_up[:n])
+            download_data = np.multiply(network_rates[:, 1], 1 / (1024 * 1024),
+                                        out=self._net_down[:n])
             
-            self.network_line_up.set_data(x_data, upload_data)
-            self.network_line_down.set_data(x_data, download_data)
-            self.ax_network.set_xlim(0, max(60, len(net_info['history'])))
+            self.network_line_up.set_data(x[:n], upload_data)
+            self.network_line_down.set_data(x[:n], download_data)
             
-            max_val = max(max(upload_data + download_data, default=1), 1)
-            self.ax_network.set_ylim(0, max_val * 1.2)
-        
-        self.canvas.draw()
+            ymax = max(float(upload_data.max()), float(download_data.max()), 1.0) * 1.2
+            # Rescaling forces a full figure redraw, skip changes under 5%.
+            # The 1.2 headroom keeps the peak on screen within that band.
+            current = self._net_ylim[1]
+            if abs(ymax - current) > 0.05 * current:
+                self._net_ylim = (0, ymax)
     
-    def update_process_list(self):
+    def update_process_list(self, processes):
         """Update the process list table"""
-        # Clear existing items
-        for item in self.process_tree.get_children():
-            self.process_tree.delete(item)
-        
-        # Get processes
-        sort_by = self.sort_var.get()
-        try:
-            limit = int(self.limit_var.get())
-        except ValueError:
-            limit = 20
-        
-        processes = self.monitor.get_process_list(sort_by=sort_by, limit=limit)
-        
-        # Insert new data
-        for proc in processes:
-            self.process_tree.insert('', 'end', values=(
+        # Rows are reused between updates, only grow or shrink the pool
+        # when the number of processes shown changes
+        row_iids = self._row_iids
+        while len(row_iids) < len(processes):
+            row_iids.append(self.process_tree.insert('', 'end', values=('', '', '', '', '')))
+        if len(row_iids) > len(processes):
+            self.process_tree.delete(*row_iids[len(processes):])
+            del row_iids[len(processes):]
+        
+        # Update rows in place
+        for iid, proc in zip(row_iids, processes):
+            self.process_tree.item(iid, values=(
                 proc['pid'],
                 proc['name'],
                 f"{proc['cpu']:.1f}",
@@ -354,6 +484,9 @@ Uptime: {info['uptime']}
     def on_closing(self):
         """Handle window closing"""
         self.running = False
+        self._ani.event_source.stop()
+        if self.logger:
+            self.logger.close()
         self.root.quit()
         self.root.destroy()
 
@@ -1,12 +1,28 @@
 """
 System Resource Monitor - macOS Menu Bar Widget
 """
+import os
+import subprocess
+import sys
 import rumps
+from Foundation import NSObject
 from system_monitor import SystemMonitor
 from config import Config
 from data_export import DataExporter, MetricsLogger
 from alerts import AlertManager
 
+
+class _MenuDelegate(NSObject):
+    """NSMenu delegate telling the app when its menu is open"""
+    app = None
+    
+    def menuWillOpen_(self, menu):
+        self.app.menu_will_open()
+    
+    def menuDidClose_(self, menu):
+        self.app.menu_did_close()
+
+
 class ResourceMonitorMenuBar(rumps.App):
     def __init__(self):
         super(ResourceMonitorMenuBar, self).__init__(name="Resource Monitor", title="⚡ ---% 🧠 ---%", quit_button=None)
@@ -30,8 +46,28 @@ class ResourceMonitorMenuBar(rumps.App):
             rumps.separator,
             self.network_up,
             self.network_down,
+            rumps.separator,
+            rumps.MenuItem("📊 Open Dashboard", callback=self.open_dashboard),
+            rumps.separator,
+            rumps.MenuItem("Quit", callback=self.quit_app),
         ]
         
+        # Last value shown per menu item, titles are only reassigned on change
+        self._last_display = {'cpu': None, 'memory': None, 'disk': None,
+                              'upload': None, 'download': None}
+        self._last_title = ""
+        
+        # CPU and memory from the last timer tick, reused when the menu opens
+        self._cpu_pct = None
+        self._mem_pct = None
+        
+        # Menu items are only refreshed while the menu is open, the title is
+        # the only part visible otherwise
+        self._menu_open = False
+        self._menu_delegate = _MenuDelegate.alloc().init()
+        self._menu_delegate.app = self
+        self.menu._menu.setDelegate_(self._menu_delegate)
+        
         # Initial update
         self.update_metrics(None)
         
@@ -41,28 +77,104 @@ class ResourceMonitorMenuBar(rumps.App):
     
     def update_metrics(self, sender):
         """Update menu bar with real metrics"""
+        if self.monitor is None:
+            return
+        
         try:
             # Get all data
-            cpu = self.monitor.get_cpu_info()
-            mem = self.monitor.get_memory_info()
-            disk = self.monitor.get_disk_info()
-            net = self.monitor.get_network_info()
-            
-            cpu_pct = cpu['percent']
-            mem_pct = mem['percent']
+            self.monitor.tick()
+            self._cpu_pct = self.monitor.get_cpu_info()['percent']
+            self._mem_pct = self.monitor.get_memory_info()['percent']
             
-            # Update menu bar title
-            self.title = f"⚡{cpu_pct:.0f}% 🧠{mem_pct:.0f}%"
+            # Update menu bar title, Cocoa redraws the status item on every
+            # assignment even if the string is identical
+            new_title = f"⚡{self._cpu_pct:.0f}% 🧠{self._mem_pct:.0f}%"
+            if new_title != self._last_title:
+                self.title = new_title
+                self._last_title = new_title
             
-            # Update menu items
-            cpu_icon = "🔴" if cpu_pct > 80 else "🟡" if cpu_pct > 50 else "🟢"
+            if self._menu_open:
+                self.update_menu_items()
+        except Exception as e:
+            print(f"Error updating metrics: {e}")
+    
+    def update_menu_items(self):
+        """Render the menu items from the last sample, without re-sampling"""
+        cpu_pct = self._cpu_pct
+        mem_pct = self._mem_pct
+        if cpu_pct is None:
+            return
+        
+        disk = self.monitor.get_disk_info()
+        net = self.monitor.get_network_info()
+        
+        # Update menu items, each title setter crosses into Cocoa so skip
+        # the ones whose displayed value hasn't changed
+        display = self._last_display
+        
+        cpu_icon = "🔴" if cpu_pct > 80 else "🟡" if cpu_pct > 50 else "🟢"
+        cpu_shown = (round(cpu_pct, 1), cpu_icon)
+        if cpu_shown != display['cpu']:
+            display['cpu'] = cpu_shown
             self.cpu_item.title = f"⚡ CPU: {cpu_pct:.1f}% {cpu_icon}"
+        
+        mem_shown = round(mem_pct, 1)
+        if mem_shown != display['memory']:
+            display['memory'] = mem_shown
             self.memory_item.title = f"🧠 Memory: {mem_pct:.1f}%"
+        
+        disk_shown = round(disk['percent'], 1)
+        if disk_shown != display['disk']:
+            display['disk'] = disk_shown
             self.disk_item.title = f"💾 Disk: {disk['percent']:.1f}%"
-            self.network_up.title = f"⬆️  Upload: {self.monitor.format_speed(net['sent_rate'])}"
-            self.network_down.title = f"⬇️  Download: {self.monitor.format_speed(net['recv_rate'])}"
+        
+        upload = self.monitor.format_speed(net['sent_rate'])
+        if upload != display['upload']:
+            display['upload'] = upload
+            self.network_up.title = f"⬆️  Upload: {upload}"
+        
+        download = self.monitor.format_speed(net['recv_rate'])
+        if download != display['download']:
+            display['download'] = download
+            self.network_down.title = f"⬇️  Download: {download}"
+    
+    def menu_will_open(self):
+        """Fill in the menu items from the last sample when the menu opens"""
+        self._menu_open = True
+        if self.monitor is None:
+            return
+        
+        try:
+            self.update_menu_items()
         except Exception as e:
-            print(f"Error updating metrics: {e}")
+            print(f"Error updating menu: {e}")
+    
+    def menu_did_close(self):
+        """Go back to updating only the title"""
+        self._menu_open = False
+    
+    def open_dashboard(self, sender):
+        """Launch the full GUI dashboard in its own process"""
+        gui_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+        try:
+            # Same interpreter as the widget (venv/bundle safe), and don't
+            # hand the child our open file descriptors
+            subprocess.Popen([sys.executable, gui_path], close_fds=True, start_new_session=True)
+        except Exception as e:
+            print(f"Error opening dashboard: {e}")
+    
+    def cleanup(self):
+        """Stop updates and release resources before exiting"""
+        self.update_timer.stop()
+        if self.logger:
+            self.logger.close()
+        self.config.flush()
+        self.monitor = None
+    
+    def quit_app(self, sender):
+        """Clean up, then quit the application"""
+        self.cleanup()
+        rumps.quit_application()
 
 def main():
     app = ResourceMonitorMenuBar()
@@ -3,15 +3,30 @@ System Resource Monitor - Core monitoring module
 Collects system metrics using psutil
 """
 
+import heapq
+import math
+import operator
 import psutil
 import platform
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Tuple
 
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 class SystemMonitor:
     """Core system monitoring class for collecting resource metrics"""
     
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = ('history_size', 'cpu_history', 'memory_history', 'network_history',
+                 'disk_io_history',
+                 'last_net_io', 'last_disk_io', 'last_check_time', '_latest',
+                 '_cores', '_threads', '_schedule', '_freq_cache',
+                 '_disk_usage', '_battery', '_proc_cache')
+    
     def __init__(self, history_size: int = 60):
         """
         Initialize the system monitor
@@ -20,116 +35,206 @@ class SystemMonitor:
             history_size: Number of historical data points to keep
         """
         self.history_size = history_size
-        self.cpu_history = []
-        self.memory_history = []
-        self.network_history = []
-        self.disk_io_history = []
+        self.cpu_history = deque(maxlen=history_size)
+        self.memory_history = deque(maxlen=history_size)
+        self.network_history = deque(maxlen=history_size)
+        self.disk_io_history = deque(maxlen=history_size)
         
         # Initialize network and disk counters
         self.last_net_io = psutil.net_io_counters()
         self.last_disk_io = psutil.disk_io_counters()
-        self.last_check_time = datetime.now()
+        self.last_check_time = time.monotonic()
+        
+        # Counters and rates from the most recent tick()
+        self._latest = {
+            'net': self.last_net_io,
+            'disk': self.last_disk_io,
+            'sent_rate': 0,
+            'recv_rate': 0,
+            'read_rate': 0,
+            'write_rate': 0
+        }
+        
+        # Core counts never change at runtime
+        self._cores = psutil.cpu_count(logical=False)
+        self._threads = psutil.cpu_count(logical=True)
+        
+        # Slow-moving sources are polled at their own rate and served from
+        # cache in between: name -> (last poll, period in seconds)
+        never = float('-inf')
+        self._schedule = {
+            'disk_usage': (never, 5.0),
+            'battery': (never, 10.0),
+            'cpu_freq': (never, 5.0),
+            'processes': (never, 10.0)
+        }
+        self._freq_cache = 0.0
+        self._disk_usage = None
+        self._battery = None
+        
+        # Process objects are kept between calls so psutil can compute each
+        # one's CPU usage from the previous call. The pid list is first read
+        # by get_process_list() and then re-read on the 'processes' schedule.
+        self._proc_cache = {}
+        
+        # Prime psutil's CPU counters so the first non-blocking read is valid
+        psutil.cpu_percent(interval=None, percpu=True)
+    
+    def _due(self, source: str) -> bool:
+        """Check whether a throttled source should be polled again"""
+        now = time.monotonic()
+        last, period = self._schedule[source]
+        if now - last >= period:
+            self._schedule[source] = (now, period)
+            return True
+        return False
+    
+    def tick(self):
+        """
+        Sample the network and disk I/O counters for this update
+        
+        Call once per update cycle, before the getters. Both rates are
+        computed over the same interval and get_disk_info/get_network_info
+        just read the stored results.
+        """
+        current_net_io = psutil.net_io_counters()
+        current_disk_io = psutil.disk_io_counters()
+        current_time = time.monotonic()
+        time_delta = current_time - self.last_check_time
+        
+        sent_rate = recv_rate = read_rate = write_rate = 0
+        if time_delta > 0:
+            if self.last_net_io:
+                sent_rate = (current_net_io.bytes_sent - self.last_net_io.bytes_sent) / time_delta
+                recv_rate = (current_net_io.bytes_recv - self.last_net_io.bytes_recv) / time_delta
+            if self.last_disk_io:
+                read_rate = (current_disk_io.read_bytes - self.last_disk_io.read_bytes) / time_delta
+                write_rate = (current_disk_io.write_bytes - self.last_disk_io.write_bytes) / time_delta
+        
+        self.last_net_io = current_net_io
+        self.last_disk_io = current_disk_io
+        self.last_check_time = current_time
+        
+        self.network_history.append((sent_rate, recv_rate))
+        
+        self._latest = {
+            'net': current_net_io,
+            'disk': current_disk_io,
+            'sent_rate': sent_rate,
+            'recv_rate': recv_rate,
+            'read_rate': read_rate,
+            'write_rate': write_rate
+        }
     
-    def get_cpu_info(self) -> Dict:
-        """Get CPU usage information"""
-        cpu_percent = psutil.cpu_percent(interval=0.1, percpu=False)
-        cpu_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
-        cpu_freq = psutil.cpu_freq()
+    def get_cpu_info(self, include_history: bool = False) -> Dict:
+        """
+        Get CPU usage information
+        
+        Args:
+            include_history: Also return a copy of the history buffer
+        """
+        # Non-blocking, measured since the previous call. The overall figure
+        # is the mean of the per-core values rather than a second sample.
+        cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_percent = sum(cpu_per_core) / len(cpu_per_core)
+        
+        if self._due('cpu_freq'):
+            cpu_freq = psutil.cpu_freq()
+            self._freq_cache = cpu_freq.current if cpu_freq else 0
         
         self.cpu_history.append(cpu_percent)
-        if len(self.cpu_history) > self.history_size:
-            self.cpu_history.pop(0)
         
-        return {
+        info = {
             'percent': cpu_percent,
             'per_core': cpu_per_core,
-            'cores': psutil.cpu_count(logical=False),
-            'threads': psutil.cpu_count(logical=True),
-            'frequency': cpu_freq.current if cpu_freq else 0,
-            'history': self.cpu_history.copy()
+            'cores': self._cores,
+            'threads': self._threads,
+            'frequency': self._freq_cache
         }
+        
+        if include_history:
+            info['history'] = list(self.cpu_history)
+        return info
     
-    def get_memory_info(self) -> Dict:
-        """Get memory usage information"""
+    def get_memory_info(self, include_history: bool = False) -> Dict:
+        """
+        Get memory usage information
+        
+        Args:
+            include_history: Also return a copy of the history buffer
+        """
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
         
         self.memory_history.append(mem.percent)
-        if len(self.memory_history) > self.history_size:
-            self.memory_history.pop(0)
         
-        return {
+        info = {
             'total': mem.total,
             'available': mem.available,
             'used': mem.used,
             'percent': mem.percent,
             'swap_total': swap.total,
             'swap_used': swap.used,
-            'swap_percent': swap.percent,
-            'history': self.memory_history.copy()
+            'swap_percent': swap.percent
         }
+        
+        if include_history:
+            info['history'] = list(self.memory_history)
+        return info
     
     def get_disk_info(self) -> Dict:
         """Get disk usage and I/O information"""
-        disk_usage = psutil.disk_usage('/')
+        if self._due('disk_usage'):
+            self._disk_usage = psutil.disk_usage('/')
+        disk_usage = self._disk_usage
         
-        # Calculate disk I/O rates
-        current_disk_io = psutil.disk_io_counters()
-        current_time = datetime.now()
-        time_delta = (current_time - self.last_check_time).total_seconds()
-        
-        if time_delta > 0 and self.last_disk_io:
-            read_rate = (current_disk_io.read_bytes - self.last_disk_io.read_bytes) / time_delta
-            write_rate = (current_disk_io.write_bytes - self.last_disk_io.write_bytes) / time_delta
-        else:
-            read_rate = 0
-            write_rate = 0
-        
-        self.last_disk_io = current_disk_io
+        # I/O counters and rates come from the last tick()
+        latest = self._latest
+        current_disk_io = latest['disk']
         
         return {
             'total': disk_usage.total,
             'used': disk_usage.used,
             'free': disk_usage.free,
             'percent': disk_usage.percent,
-            'read_rate': read_rate,
-            'write_rate': write_rate,
+            'read_rate': latest['read_rate'],
+            'write_rate': latest['write_rate'],
             'read_count': current_disk_io.read_count,
             'write_count': current_disk_io.write_count
         }
     
-    def get_network_info(self) -> Dict:
-        """Get network usage information"""
-        current_net_io = psutil.net_io_counters()
-        current_time = datetime.now()
-        time_delta = (current_time - self.last_check_time).total_seconds()
-        
-        if time_delta > 0 and self.last_net_io:
-            sent_rate = (current_net_io.bytes_sent - self.last_net_io.bytes_sent) / time_delta
-            recv_rate = (current_net_io.bytes_recv - self.last_net_io.bytes_recv) / time_delta
-        else:
-            sent_rate = 0
-            recv_rate = 0
-        
-        self.last_net_io = current_net_io
-        self.last_check_time = current_time
+    def get_network_info(self, include_history: bool = False) -> Dict:
+        """
+        Get network usage information
         
-        self.network_history.append((sent_rate, recv_rate))
-        if len(self.network_history) > self.history_size:
-            self.network_history.pop(0)
+        Args:
+            include_history: Also return a copy of the history buffer
+        """
+        # Counters and rates come from the last tick()
+        latest = self._latest
+        current_net_io = latest['net']
         
-        return {
+        info = {
             'bytes_sent': current_net_io.bytes_sent,
             'bytes_recv': current_net_io.bytes_recv,
-            'sent_rate': sent_rate,
-            'recv_rate': recv_rate,
+            'sent_rate': latest['sent_rate'],
+            'recv_rate': latest['recv_rate'],
             'packets_sent': current_net_io.packets_sent,
-            'packets_recv': current_net_io.packets_recv,
-            'history': self.network_history.copy()
+            'packets_recv': current_net_io.packets_recv
         }
+        
+        if include_history:
+            info['history'] = list(self.network_history)
+        return info
     
     def get_battery_info(self) -> Dict:
         """Get battery information (macOS specific)"""
+        if self._due('battery'):
+            self._battery = self._read_battery()
+        return self._battery
+    
+    def _read_battery(self) -> Dict:
+        """Read battery state from psutil"""
         try:
             battery = psutil.sensors_battery()
             if battery:
@@ -143,6 +248,25 @@ class SystemMonitor:
         
         return None
     
+    def _refresh_proc_cache(self):
+        """Pick up new processes and drop exited ones"""
+        cache = self._proc_cache
+        current = {}
+        for proc in psutil.process_iter():
+            cached = cache.get(proc.pid)
+            if cached is None or cached != proc:
+                # New process (or a reused pid), prime its CPU counter
+                try:
+                    proc.cpu_percent(interval=None)
+                except (psutil.ZombieProcess, psutil.AccessDenied):
+                    # Still listed, as_dict() reports the missing fields as None
+                    pass
+                except psutil.NoSuchProcess:
+                    continue
+                cached = proc
+            current[proc.pid] = cached
+        self._proc_cache = current
+    
     def get_process_list(self, sort_by: str = 'cpu', limit: int = 10) -> List[Dict]:
         """
         Get list of top processes
@@ -151,30 +275,45 @@ class SystemMonitor:
             sort_by: Sort key ('cpu', 'memory', 'name')
             limit: Maximum number of processes to return
         """
+        # Lightweight (cpu, memory, pid, name, status) tuples, dicts are only
+        # built for the processes actually returned
         processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+        if self._due('processes'):
+            self._refresh_proc_cache()
+        
+        cache = self._proc_cache
+        for pid, proc in list(cache.items()):
             try:
-                pinfo = proc.info
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'cpu': pinfo['cpu_percent'] or 0,
-                    'memory': pinfo['memory_percent'] or 0,
-                    'status': pinfo['status']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        
-        # Sort processes
+                # Batch the per-field kernel queries into a single read
+                with proc.oneshot():
+                    pinfo = proc.as_dict(attrs=['pid', 'name', 'cpu_percent',
+                                                'memory_percent', 'status'])
+                processes.append((
+                    pinfo['cpu_percent'] or 0,
+                    pinfo['memory_percent'] or 0,
+                    pinfo['pid'],
+                    pinfo['name'],
+                    pinfo['status']
+                ))
+            except psutil.NoSuchProcess:
+                # Exited since the last refresh
+                del cache[pid]
+        
+        # Sort processes, only the top entries are needed for cpu/memory
         if sort_by == 'cpu':
-            processes.sort(key=lambda x: x['cpu'], reverse=True)
+            top = heapq.nlargest(limit, processes, key=operator.itemgetter(0))
         elif sort_by == 'memory':
-            processes.sort(key=lambda x: x['memory'], reverse=True)
-        elif sort_by == 'name':
-            processes.sort(key=lambda x: x['name'].lower())
+            top = heapq.nlargest(limit, processes, key=operator.itemgetter(1))
+        else:
+            if sort_by == 'name':
+                processes.sort(key=lambda x: (x[3] or '').lower())
+            top = processes[:limit]
         
-        return processes[:limit]
+        return [
+            {'pid': pid, 'name': name, 'cpu': cpu, 'memory': memory, 'status': status}
+            for cpu, memory, pid, name, status in top
+        ]
     
     def get_system_info(self) -> Dict:
         """Get general system information"""
@@ -195,11 +334,9 @@ class SystemMonitor:
     @staticmethod
     def format_bytes(bytes_value: float) -> str:
         """Format bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        # frexp gives the exact binary exponent, so every 10 bits is one unit
+        i = min((math.frexp(bytes_value)[1] - 1) // 10, 5) if bytes_value >= 1024 else 0
+        return f"{bytes_value / (1 << (i * 10)):.2f} {_UNITS[i]}"
     
     @staticmethod
     def format_speed(bytes_per_sec: float) -> str: